@@ -58,12 +58,16 @@ Notes:
 
 
 import argparse
+import concurrent.futures
 import curses
+import errno
+import functools
 import os
 import re
 import shutil
 import sys
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Deque, Iterator, List, Optional, Pattern, Tuple
 
 # Default keyword list for general highlighting
 DEFAULT_KEYWORDS = [
@@ -74,6 +78,52 @@ DEFAULT_KEYWORDS = [
     "Intel Thunderbolt"
 ]
 
+# Pane rows drawn between checks for pending input
+RENDER_CHUNK_ROWS = 8
+
+# Payload extensions tried next to a CRI when its ImageFile is missing or absent
+PAYLOAD_EXTS = (".imz", ".7z")
+
+# DEFAULT_KEYWORDS never change at runtime, so their alternation is compiled once here
+_DEFAULT_KW_ALT = "|".join(re.escape(k) for k in DEFAULT_KEYWORDS)
+_DEFAULT_KW_RE = re.compile("(?P<k>" + _DEFAULT_KW_ALT + ")", re.IGNORECASE)
+# Character class of keyword first letters: text without any of them cannot match
+_KW_FIRST_CHARS_RE = (
+    re.compile("[" + "".join(sorted({re.escape(k[0]) for k in DEFAULT_KEYWORDS if k})) + "]", re.IGNORECASE)
+    if DEFAULT_KEYWORDS else None
+)
+
+# Typical payload pointer keys in a CRI (priority order)
+_IMAGE_KEYS = ("ImageFile", "IMZ", "Target", "FileName", "Payload")
+
+# CRI files are parsed as bytes; only the values of these keys are ever decoded
+_CRI_KV_RE = re.compile(rb'^\s*([A-Za-z0-9_]+)\s*=\s*(.*)', re.MULTILINE)
+_CRI_WANTED_KEYS = frozenset(
+    k.encode("ascii") for k in ("ModuleName", "ModuleThis", "Description") + _IMAGE_KEYS
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_search(search_kw: str) -> Pattern[str]:
+    """Case-insensitive pattern for a search keyword (memoized across redraws)."""
+    return re.compile("(" + re.escape(search_kw) + ")", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_combined(search_kw: str) -> Pattern[str]:
+    """
+    Search keyword first, then default keywords, as a single alternation.
+    Group 's' is the search hit and group 'k' a default keyword (see Match.lastgroup).
+    """
+    if not _DEFAULT_KW_ALT:
+        return re.compile("(?P<s>" + re.escape(search_kw) + ")", re.IGNORECASE)
+    return re.compile("(?P<s>" + re.escape(search_kw) + ")|(?P<k>" + _DEFAULT_KW_ALT + ")", re.IGNORECASE)
+
+
+def _put(win, y: int, x: int, text: str, attr: int, avail: int) -> None:
+    """addstr of text clipped to avail cells (the caller already tracks the width)."""
+    win.addstr(y, x, text[:avail], attr)
+
 
 class RecoveryItem:
     """Represents a Lenovo Recovery module discovered via a .CRI file."""
@@ -86,19 +136,50 @@ class RecoveryItem:
         self.module_this = module_this
         self.description = description
         self.image_file = image_file  # IMZ/7z filename referenced in CRI (e.g., ImageFile=xxx.imz)
-        self.selected = False
+        self.sort_key = os.path.basename(cri_path).lower()  # pane ordering, computed once
+        self._selected = False
+        # (text, prefix, desc) rendered row; rebuilt only after `selected` flips
+        self._render_cache: Optional[Tuple[str, str]] = None
+
+    @property
+    def selected(self) -> bool:
+        return self._selected
+
+    @selected.setter
+    def selected(self, value: bool) -> None:
+        if value != self._selected:
+            self._selected = value
+            self._render_cache = None
+
+    def relocate(self, cri_path: str, imz_path: Optional[str]) -> None:
+        """Point the item at its files after a move."""
+        self.cri_path = cri_path
+        self.imz_path = imz_path
+        self.sort_key = os.path.basename(cri_path).lower()
+        self._render_cache = None
 
     @property
     def basename(self) -> str:
         return os.path.splitext(os.path.basename(self.cri_path))[0]
 
-    def display_text(self) -> str:
-        checkbox = "[X]" if self.selected else "[ ]"
+    def _build_render_cache(self) -> Tuple[str, str]:
+        checkbox = "[X]" if self._selected else "[ ]"
         mt = self.module_this or self.module_name or self.basename
         desc = self.description or ""
         # Show payload hint only if present
         suffix = f" (Payload: {os.path.basename(self.imz_path)})" if self.imz_path else ""
-        return f"{checkbox} {mt} - {desc}{suffix}"
+        text = f"{checkbox} {mt} - {desc}{suffix}"
+        parts = text.split(" - ", 1)
+        if len(parts) == 2:
+            cache = (parts[0] + " - ", parts[1])
+        else:
+            cache = (text, "")
+        self._render_cache = cache
+        return cache
+
+    def render(self) -> Tuple[str, str]:
+        """Return the row text split into (prefix, description) for drawing."""
+        return self._render_cache or self._build_render_cache()
 
 
 class RecoveryManager:
@@ -106,7 +187,8 @@ class RecoveryManager:
     def __init__(self, recovery_dir: str) -> None:
         self.recovery_dir = os.path.abspath(recovery_dir)
         self.archives_dir = os.path.join(self.recovery_dir, "archives")
-        self.errors: List[str] = []
+        # Only the newest errors are ever shown, so keep a bounded history
+        self.errors: Deque[str] = deque(maxlen=64)
         self._ensure_archives_dir()
         self.recovery_items: List[RecoveryItem] = []
         self.archive_items: List[RecoveryItem] = []
@@ -124,101 +206,126 @@ class RecoveryManager:
     def _scan_dir(self, d: str) -> List[RecoveryItem]:
         items: List[RecoveryItem] = []
         try:
-            for entry in sorted(os.listdir(d)):
-                if entry.lower().endswith(".cri"):
-                    cri_path = os.path.join(d, entry)
-                    module_name, module_this, description, image_file = self._parse_cri(cri_path)
-
-                    # Resolve payload path (IMZ or 7z) using CRI-declared image_file if present
-                    payload_path = None
-                    if image_file:
-                        imz_name = image_file.strip().strip('"').strip("'")
-                        candidate = os.path.join(d, imz_name)
-                        if os.path.exists(candidate):
-                            payload_path = candidate
-                        else:
-                            # fallback: try common extensions matching the CRI basename
-                            base = os.path.splitext(entry)[0]
-                            for ext in (".imz", ".7z"):
-                                alt = os.path.join(d, base + ext)
-                                if os.path.exists(alt):
-                                    payload_path = alt
-                                    break
-                            # No payload found: this can be a script-only CRI; no error
-                    else:
-                        # no ImageFile declared: try basename with common payload extensions
-                        base = os.path.splitext(entry)[0]
-                        for ext in (".imz", ".7z"):
-                            candidate = os.path.join(d, base + ext)
-                            if os.path.exists(candidate):
-                                payload_path = candidate
-                                break
-                        # No payload found: script-only is OK; no error
-
-                    items.append(RecoveryItem(
-                        cri_path=cri_path,
-                        imz_path=payload_path,
-                        module_name=module_name,
-                        module_this=module_this,
-                        description=description,
-                        image_file=image_file
-                    ))
+            # One directory pass; payload lookups below are answered from these names
+            # instead of stat-ing every candidate path.
+            with os.scandir(d) as it:
+                dir_entries = sorted(it, key=lambda e: e.name.lower())
+            names = {e.name for e in dir_entries}
+            names_folded = {e.name.lower(): e.name for e in dir_entries}
+
+            def find_payload(name: str) -> Optional[str]:
+                if os.sep in name or (os.altsep and os.altsep in name):
+                    candidate = os.path.join(d, name)
+                    return candidate if os.path.exists(candidate) else None
+                if name not in names:
+                    name = names_folded.get(name.lower(), "")
+                    if not name:
+                        return None
+                return os.path.join(d, name)
+
+            cri_entries = [e for e in dir_entries if e.name.lower().endswith(".cri") and e.is_file()]
+            parsed_cris = self._parse_cris(cri_entries)
+
+            for dir_entry, parsed in zip(cri_entries, parsed_cris):
+                entry = dir_entry.name
+                cri_path = dir_entry.path
+                module_name, module_this, description, image_file = parsed
+
+                # Resolve payload path (IMZ or 7z) using CRI-declared image_file if present
+                payload_path = None
+                if image_file:
+                    imz_name = image_file.strip().strip('"').strip("'")
+                    payload_path = find_payload(imz_name)
+                if payload_path is None:
+                    # fallback (or no ImageFile declared): CRI basename with common payload extensions
+                    base = os.path.splitext(entry)[0]
+                    for ext in PAYLOAD_EXTS:
+                        payload_path = find_payload(base + ext)
+                        if payload_path:
+                            break
+                    # No payload found: this can be a script-only CRI; no error
+
+                items.append(RecoveryItem(
+                    cri_path=cri_path,
+                    imz_path=payload_path,
+                    module_name=module_name,
+                    module_this=module_this,
+                    description=description,
+                    image_file=image_file
+                ))
         except Exception as e:
             self.errors.append(f"Scan error in {d}: {e}")
         return items
 
+    def _parse_cris(self, cri_entries: List[os.DirEntry]) -> List[Tuple[str, str, str, str]]:
+        """Parse CRI files in order, reading them concurrently on a thread pool."""
+        paths = [entry.path for entry in cri_entries]
+        if len(paths) > 1:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+                return list(ex.map(self._parse_cri, paths))
+        return [self._parse_cri(path) for path in paths]
+
     def _parse_cri(self, path: str) -> Tuple[str, str, str, str]:
         """
         Parse .CRI as simple key=value pairs using regex.
         Returns (ModuleName, ModuleThis, Description, ImageFile). Missing keys -> "".
         """
         try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            with open(path, "rb") as f:
                 content = f.read()
         except Exception as e:
             self.errors.append(f"Error reading {os.path.basename(path)}: {e}")
             return "", "", "", ""
 
-        # Raw string to avoid invalid escape warnings
-        kv_pattern = re.compile(r'^\s*([A-Za-z0-9_]+)\s*=\s*(.*)\s*$', re.MULTILINE)
         data = {}
-        for m in kv_pattern.finditer(content):
+        for m in _CRI_KV_RE.finditer(content):
             key = m.group(1)
-            val = m.group(2).strip()
-            data[key] = val
+            if key in _CRI_WANTED_KEYS:
+                data[key.decode("ascii")] = m.group(2).decode("utf-8", "ignore").strip()
 
         module_name = data.get("ModuleName", "") or ""
         module_this = data.get("ModuleThis", "") or ""
         description = data.get("Description", "") or ""
 
-        # Try typical payload pointer keys (priority order)
-        image_file = (
-            data.get("ImageFile")
-            or data.get("IMZ")
-            or data.get("Target")
-            or data.get("FileName")
-            or data.get("Payload")
-            or ""
-        )
+        # First non-empty payload pointer key wins
+        image_file = next((data[k] for k in _IMAGE_KEYS if data.get(k)), "")
 
         return module_name, module_this, description, image_file
 
+    @staticmethod
+    def _move_file(src: str, dst: str) -> None:
+        """
+        Rename src to dst in place. archives/ sits inside RECOVERY, so this is a
+        single rename; shutil.move is only used if the two end up on different devices.
+        """
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)
+
     def move_selected(self, from_archives: bool) -> None:
         """
         Move all selected items from one pane to the other.
         Moves the .CRI file and the corresponding payload (IMZ/7z) if present.
+        Only the moved items are updated; the directories are not rescanned.
         """
         src_items = self.archive_items if from_archives else self.recovery_items
+        dst_items = self.recovery_items if from_archives else self.archive_items
         dst_dir = self.recovery_dir if from_archives else self.archives_dir
 
         remaining: List[RecoveryItem] = []
+        moved: List[RecoveryItem] = []
         for item in src_items:
             if not item.selected:
                 remaining.append(item)
                 continue
 
+            new_cri_path = os.path.join(dst_dir, os.path.basename(item.cri_path))
             try:
-                shutil.move(item.cri_path, os.path.join(dst_dir, os.path.basename(item.cri_path)))
+                self._move_file(item.cri_path, new_cri_path)
             except Exception as e:
                 self.errors.append(f"Failed to move CRI {os.path.basename(item.cri_path)}: {e}")
                 item.selected = False
@@ -226,18 +333,28 @@ class RecoveryManager:
                 continue
 
             # Move payload if present (IMZ or 7z); no alarm if missing (script-only CRI)
+            new_imz_path = None
             if item.imz_path and os.path.exists(item.imz_path):
                 try:
-                    shutil.move(item.imz_path, os.path.join(dst_dir, os.path.basename(item.imz_path)))
+                    new_imz_path = os.path.join(dst_dir, os.path.basename(item.imz_path))
+                    self._move_file(item.imz_path, new_imz_path)
                 except Exception as e:
+                    new_imz_path = None
                     self.errors.append(f"Moved CRI but failed payload {os.path.basename(item.imz_path)}: {e}")
 
+            item.relocate(new_cri_path, new_imz_path)
+            moved.append(item)
+
+        # os.replace overwrote any same-named CRI already there; drop its stale row
+        moved_paths = {os.path.normcase(item.cri_path) for item in moved}
+        dst_items[:] = [item for item in dst_items if os.path.normcase(item.cri_path) not in moved_paths]
+        dst_items.extend(moved)
+        dst_items.sort(key=lambda i: i.sort_key)
         if from_archives:
             self.archive_items = remaining
         else:
             self.recovery_items = remaining
 
-        self.scan()
         for it in self.recovery_items + self.archive_items:
             it.selected = False
 
@@ -252,6 +369,18 @@ class RecoveryUI:
         self.scroll_left = 0
         self.scroll_right = 0
         self.search_keyword: str = ""
+        # Screen regions needing a repaint: left pane, right pane, status bar
+        self._dirty = {"L": True, "R": True, "S": True}
+        self._relayout = True
+        # Color attributes, resolved once in _init_colors()
+        self.cp_cursor = curses.A_NORMAL
+        self.cp_selected = curses.A_NORMAL
+        self.cp_header = curses.A_BOLD
+        self.cp_keyword = curses.A_NORMAL
+        self.cp_error = curses.A_NORMAL
+        self.cp_search = curses.A_NORMAL
+        self.cp_selected_cursor = curses.A_NORMAL
+        self.cp_keyword_cursor = curses.A_NORMAL
 
     def run(self) -> None:
         curses.wrapper(self._main)
@@ -271,69 +400,158 @@ class RecoveryUI:
         curses.init_pair(7, curses.COLOR_YELLOW, curses.COLOR_WHITE)  # selected + cursor
         curses.init_pair(8, curses.COLOR_GREEN, curses.COLOR_WHITE)   # default keywords on cursor line
 
+        self.cp_cursor = curses.color_pair(1)
+        self.cp_selected = curses.color_pair(2)
+        self.cp_header = curses.color_pair(3) | curses.A_BOLD
+        self.cp_keyword = curses.color_pair(4)
+        self.cp_error = curses.color_pair(5)
+        self.cp_search = curses.color_pair(6)
+        self.cp_selected_cursor = curses.color_pair(7)
+        self.cp_keyword_cursor = curses.color_pair(8)
+
     def _main(self, stdscr) -> None:
         curses.curs_set(0)
         self._init_colors()
         self.m.scan()
 
+        status_h = 4
+        self._relayout = True
         while True:
-            stdscr.clear()
-            h, w = stdscr.getmaxyx()
-            status_h = 4
-            content_h = max(0, h - status_h)
-            left_w = w // 2
-            right_w = w - left_w
-
-            left_win = stdscr.derwin(content_h, left_w, 0, 0)
-            right_win = stdscr.derwin(content_h, right_w, 0, left_w)
+            if self._relayout:
+                # Full clear only when the window geometry may have changed
+                stdscr.clear()
+                h, w = stdscr.getmaxyx()
+                content_h = max(0, h - status_h)
+                left_w = w // 2
+                right_w = w - left_w
+
+                left_win = stdscr.derwin(content_h, left_w, 0, 0)
+                right_win = stdscr.derwin(content_h, right_w, 0, left_w)
+                status_win = stdscr.derwin(status_h, w, h - status_h, 0)
+                stdscr.noutrefresh()
+                self._mark_dirty("L", "R", "S")
+                self._relayout = False
 
             self.cursor_idx_left = self._clamp_index(self.cursor_idx_left, len(self.m.recovery_items))
             self.cursor_idx_right = self._clamp_index(self.cursor_idx_right, len(self.m.archive_items))
 
-            self._draw_pane(left_win, "RECOVERY", self.m.recovery_items,
-                            focused=not self.focus_archives,
-                            cursor_idx=self.cursor_idx_left,
-                            scroll=self.scroll_left)
-
-            self._draw_pane(right_win, "archives", self.m.archive_items,
-                            focused=self.focus_archives,
-                            cursor_idx=self.cursor_idx_right,
-                            scroll=self.scroll_right)
-
-            status_win = stdscr.derwin(status_h, w, h - status_h, 0)
-            self._draw_status(status_win)
-
-            stdscr.refresh()
-            ch = stdscr.getch()
-
-            if ch in (ord('q'), ord('Q')):
+            # Panes are drawn in chunks; a key arriving mid-draw is handled first and
+            # the pane, still dirty, is drawn again with the new state.
+            if self._dirty["L"] and self._draw_until_input(stdscr, self._draw_pane_rows(
+                    left_win, "RECOVERY", self.m.recovery_items,
+                    focused=not self.focus_archives,
+                    cursor_idx=self.cursor_idx_left,
+                    scroll=self.scroll_left)):
+                self._dirty["L"] = False
+
+            if self._dirty["R"] and self._draw_until_input(stdscr, self._draw_pane_rows(
+                    right_win, "archives", self.m.archive_items,
+                    focused=self.focus_archives,
+                    cursor_idx=self.cursor_idx_right,
+                    scroll=self.scroll_right)):
+                self._dirty["R"] = False
+
+            if self._dirty["S"]:
+                self._draw_status(status_win)
+                self._dirty["S"] = False
+
+            curses.doupdate()
+
+            running = True
+            for ch in self._read_key_burst(stdscr):
+                if not self._handle_key(stdscr, ch, content_h):
+                    running = False
+                    break
+            if not running:
                 break
-            elif ch in (9, getattr(curses, "KEY_TAB", None)):
-                self.focus_archives = not self.focus_archives
-            elif ch == curses.KEY_UP:
-                self._move_cursor(-1, content_h)
-            elif ch == curses.KEY_DOWN:
-                self._move_cursor(1, content_h)
-            elif ch == curses.KEY_PPAGE:
-                self._move_cursor(-10, content_h)
-            elif ch == curses.KEY_NPAGE:
-                self._move_cursor(10, content_h)
-            elif ch == ord(' '):
-                self._toggle_selection()
-            elif ch in (curses.KEY_ENTER, 10, 13):
-                self.m.move_selected(from_archives=self.focus_archives)
-                self._clamp_cursors()
-            elif ch == 6:  # Ctrl+F
-                keyword = self._prompt_search(stdscr)
-                self.search_keyword = keyword.strip()
-            else:
-                pass
+
+    def _draw_until_input(self, stdscr, rows: Iterator[None]) -> bool:
+        """
+        Run a chunked draw, polling for input between chunks. Returns True if the
+        draw completed, False if it was abandoned because a key is waiting (the
+        key is pushed back for _read_key_burst).
+        """
+        for _ in rows:
+            stdscr.nodelay(True)
+            try:
+                ch = stdscr.getch()
+            finally:
+                stdscr.nodelay(False)
+            if ch != -1:
+                curses.ungetch(ch)
+                rows.close()
+                return False
+        return True
+
+    def _read_key_burst(self, stdscr) -> List[int]:
+        """
+        Block for one key, then collect any keys already queued behind it (e.g.
+        arrow-key autorepeat) so the whole burst is applied before one redraw.
+        Stops after Ctrl+F, whose prompt must read the keys that follow it.
+        """
+        keys = [stdscr.getch()]
+        if keys[0] == 6:
+            return keys
+        stdscr.nodelay(True)
+        try:
+            while True:
+                ch = stdscr.getch()
+                if ch == -1:
+                    break
+                keys.append(ch)
+                if ch == 6:
+                    break
+        finally:
+            stdscr.nodelay(False)
+        return keys
+
+    def _handle_key(self, stdscr, ch: int, content_h: int) -> bool:
+        """Apply one key press to the UI state. Returns False when the user quits."""
+        if ch in (ord('q'), ord('Q')):
+            return False
+        elif ch == curses.KEY_RESIZE:
+            self._relayout = True
+        elif ch in (9, getattr(curses, "KEY_TAB", None)):
+            self.focus_archives = not self.focus_archives
+            self._mark_dirty("L", "R", "S")
+        elif ch == curses.KEY_UP:
+            self._move_cursor(-1, content_h)
+            self._mark_dirty(self._focused_region(), "S")
+        elif ch == curses.KEY_DOWN:
+            self._move_cursor(1, content_h)
+            self._mark_dirty(self._focused_region(), "S")
+        elif ch == curses.KEY_PPAGE:
+            self._move_cursor(-10, content_h)
+            self._mark_dirty(self._focused_region(), "S")
+        elif ch == curses.KEY_NPAGE:
+            self._move_cursor(10, content_h)
+            self._mark_dirty(self._focused_region(), "S")
+        elif ch == ord(' '):
+            self._toggle_selection()
+            self._mark_dirty(self._focused_region())
+        elif ch in (curses.KEY_ENTER, 10, 13):
+            self.m.move_selected(from_archives=self.focus_archives)
+            self._clamp_cursors()
+            self._mark_dirty("L", "R", "S")
+        elif ch == 6:  # Ctrl+F
+            keyword = self._prompt_search(stdscr)
+            self.search_keyword = keyword.strip()
+            # Search highlighting lives in both panes; the prompt overwrote the status bar
+            self._mark_dirty("L", "R", "S")
+        return True
+
+    def _mark_dirty(self, *regions: str) -> None:
+        for region in regions:
+            self._dirty[region] = True
+
+    def _focused_region(self) -> str:
+        return "R" if self.focus_archives else "L"
 
     def _prompt_search(self, stdscr) -> str:
         h, w = stdscr.getmaxyx()
         prompt = "Search keyword (empty to clear): "
         try:
-            stdscr.addnstr(h - 1, 0, prompt, w, curses.A_BOLD)
+            _put(stdscr, h - 1, 0, prompt, curses.A_BOLD, w)
         except curses.error:
             pass
         curses.echo()
@@ -392,14 +610,19 @@ class RecoveryUI:
         if 0 <= cursor_idx < len(items):
             items[cursor_idx].selected = not items[cursor_idx].selected
 
-    def _draw_pane(self, win, title: str, items: List[RecoveryItem],
-                   focused: bool, cursor_idx: int, scroll: int) -> None:
+    def _draw_pane_rows(self, win, title: str, items: List[RecoveryItem],
+                        focused: bool, cursor_idx: int, scroll: int) -> Iterator[None]:
+        """
+        Draw a pane, yielding every RENDER_CHUNK_ROWS rows so the caller can stop
+        early when input is pending. The window is only queued for output
+        (noutrefresh) once every visible row has been drawn.
+        """
         win.erase()
         h, w = win.getmaxyx()
         header = f" {title} "
-        header_attr = curses.color_pair(3) | curses.A_BOLD
+        header_attr = self.cp_header
         try:
-            win.addnstr(0, 0, header.ljust(w), w, header_attr)
+            _put(win, 0, 0, header.ljust(w), header_attr, w)
         except curses.error:
             pass
 
@@ -410,23 +633,20 @@ class RecoveryUI:
         if focused:
             self._set_current_cursor_scroll(cursor_idx, scroll)
 
+        # Row attributes indexed by (is_cursor << 1) | selected
+        attr_tbl = (curses.A_NORMAL, self.cp_selected, self.cp_cursor, self.cp_selected_cursor)
+        # Default keyword highlight color indexed by is_cursor (green or green-on-white)
+        kw_attr_tbl = (self.cp_keyword, self.cp_keyword_cursor)
+
         for i in range(viewport_h):
             idx = scroll + i
             if idx >= len(items):
                 break
             item = items[idx]
             is_cursor = (focused and idx == cursor_idx)
-            if is_cursor and item.selected:
-                base_attr = curses.color_pair(7)
-            elif is_cursor:
-                base_attr = curses.color_pair(1)
-            elif item.selected:
-                base_attr = curses.color_pair(2)
-            else:
-                base_attr = curses.A_NORMAL
+            base_attr = attr_tbl[(is_cursor << 1) | item.selected]
 
-            row_text = item.display_text()
-            prefix, desc = self._split_prefix_desc(row_text)
+            prefix, desc = item.render()
 
             # Draw prefix with search highlighting if active
             try:
@@ -436,8 +656,7 @@ class RecoveryUI:
 
             desc_x = min(len(prefix), max(0, w - 1))
 
-            # Default keyword highlight color (green or green-on-white)
-            default_kw_attr = curses.color_pair(8) if is_cursor else curses.color_pair(4)
+            default_kw_attr = kw_attr_tbl[is_cursor]
 
             # Combine highlights: search keyword (red) and default keywords (green)
             self._add_desc_with_combined_keywords(
@@ -446,61 +665,31 @@ class RecoveryUI:
                 default_kw_attr=default_kw_attr,
                 max_w=w
             )
+            if i % RENDER_CHUNK_ROWS == RENDER_CHUNK_ROWS - 1:
+                yield
 
         win.noutrefresh()
 
-    def _split_prefix_desc(self, row_text: str) -> Tuple[str, str]:
-        parts = row_text.split(" - ", 1)
-        if len(parts) == 2:
-            return parts[0] + " - ", parts[1]
-        else:
-            return row_text, ""
-
     def _add_text_with_search(self, win, y: int, x: int, text: str,
                               base_attr: int, search_kw: str, max_w: int) -> None:
         if max_w <= 0 or x >= max_w or not text:
             return
-        available = max_w - x
-        if available <= 0:
-            return
 
         if not search_kw:
-            try:
-                win.addnstr(y, x, text, available, base_attr)
-            except curses.error:
-                pass
+            self._write_segments(win, y, x, [(text, base_attr)], max_w)
             return
 
-        pattern = re.compile(re.escape(search_kw), re.IGNORECASE)
+        segments: List[Tuple[str, int]] = []
         pos = 0
-        for m in pattern.finditer(text):
+        for m in _compile_search(search_kw).finditer(text):
             start, end = m.span()
-            before = text[pos:start]
-            if before:
-                try:
-                    win.addnstr(y, x, before, available, base_attr)
-                except curses.error:
-                    pass
-                x += len(before)
-                available -= len(before)
-                if available <= 0:
-                    return
-            kw = text[start:end]
-            try:
-                win.addnstr(y, x, kw, available, curses.color_pair(6))
-            except curses.error:
-                pass
-            x += len(kw)
-            available -= len(kw)
-            if available <= 0:
-                return
+            if start > pos:
+                segments.append((text[pos:start], base_attr))
+            segments.append((text[start:end], self.cp_search))
             pos = end
-        tail = text[pos:]
-        if tail and available > 0:
-            try:
-                win.addnstr(y, x, tail, available, base_attr)
-            except curses.error:
-                pass
+        if pos < len(text):
+            segments.append((text[pos:], base_attr))
+        self._write_segments(win, y, x, segments, max_w)
 
     def _add_desc_with_combined_keywords(self, win, y: int, x: int, text: str,
                                          base_attr: int, search_kw: str,
@@ -512,63 +701,56 @@ class RecoveryUI:
         """
         if max_w <= 0 or x >= max_w or not text:
             return
-        available = max_w - x
-        if available <= 0:
-            return
 
-        # Build combined pattern: search keyword first (if any), then default keywords
-        parts = []
+        # Combined pattern: search keyword first (if any), then default keywords
         if search_kw:
-            parts.append(re.escape(search_kw))
-        if DEFAULT_KEYWORDS:
-            parts.extend(re.escape(k) for k in DEFAULT_KEYWORDS)
-        if not parts:
-            try:
-                win.addnstr(y, x, text, available, base_attr)
-            except curses.error:
-                pass
+            pattern = _compile_combined(search_kw)
+        elif _KW_FIRST_CHARS_RE is not None and _KW_FIRST_CHARS_RE.search(text):
+            pattern = _DEFAULT_KW_RE
+        else:
+            # Nothing to highlight: one plain write
+            self._write_segments(win, y, x, [(text, base_attr)], max_w)
             return
 
-        pattern = re.compile("(" + "|".join(parts) + ")", re.IGNORECASE)
+        segments: List[Tuple[str, int]] = []
         pos = 0
-        while True:
-            m = pattern.search(text, pos)
-            if not m:
-                break
+        for m in pattern.finditer(text):
             start, end = m.span()
-            before = text[pos:start]
-            if before:
-                try:
-                    win.addnstr(y, x, before, available, base_attr)
-                except curses.error:
-                    pass
-                x += len(before)
-                available -= len(before)
-                if available <= 0:
-                    return
+            if start > pos:
+                segments.append((text[pos:start], base_attr))
 
-            kw = text[start:end]
-            # If kw matches search_keyword exactly (case-insensitive), color red; else default keyword color
-            if search_kw and re.fullmatch(re.escape(search_kw), kw, re.IGNORECASE):
-                attr = curses.color_pair(6)
-            else:
-                attr = default_kw_attr
-            try:
-                win.addnstr(y, x, kw, available, attr)
-            except curses.error:
-                pass
-            x += len(kw)
-            available -= len(kw)
-            if available <= 0:
-                return
+            # Search keyword hit (group 's') in red; default keyword (group 'k') in green
+            attr = self.cp_search if m.lastgroup == "s" else default_kw_attr
+            segments.append((text[start:end], attr))
             pos = end
 
-        tail = text[pos:]
-        if tail and available > 0:
-            try:
-                win.addnstr(y, x, tail, available, base_attr)
-            except curses.error:
-                pass
+        if pos < len(text):
+            segments.append((text[pos:], base_attr))
+        self._write_segments(win, y, x, segments, max_w)
+
+    def _write_segments(self, win, y: int, x: int,
+                        segments: List[Tuple[str, int]], max_w: int) -> None:
+        """
+        Write (text, attr) segments left to right, clipped at max_w.
+        Adjacent segments with the same attribute are merged into one write.
+        """
+        runs: List[Tuple[str, int]] = []
+        for text, attr in segments:
+            if runs and runs[-1][1] == attr:
+                runs[-1] = (runs[-1][0] + text, attr)
+            else:
+                runs.append((text, attr))
+
+        available = max_w - x
+        try:
+            for text, attr in runs:
+                if available <= 0:
+                    break
+                _put(win, y, x, text, attr, available)
+                x += len(text)
+                available -= len(text)
+        except curses.error:
+            pass
 
     def _draw_status(self, win) -> None:
         win.erase()
@@ -576,34 +758,34 @@ class RecoveryUI:
         focus = "archives" if self.focus_archives else "RECOVERY"
         line1 = f" Lenovo Recovery Manager  |  Focus: {focus} "
         try:
-            win.addnstr(0, 0, line1.ljust(w), w, curses.A_BOLD)
+            _put(win, 0, 0, line1.ljust(w), curses.A_BOLD, w)
         except curses.error:
             pass
 
         help_text = " TAB: switch  SPACE: select  ENTER: move  ↑/↓: navigate  PgUp/PgDn: fast scroll  Ctrl+F: search  Q: quit "
         try:
-            win.addnstr(1, 0, help_text.ljust(w), w, curses.A_DIM)
+            _put(win, 1, 0, help_text.ljust(w), curses.A_DIM, w)
         except curses.error:
             pass
 
         search_info = f" | Search: '{self.search_keyword}'" if self.search_keyword else ""
         counts = f" RECOVERY: {len(self.m.recovery_items)}  |  archives: {len(self.m.archive_items)}{search_info} "
         try:
-            win.addnstr(2, 0, counts.ljust(w), w, curses.A_NORMAL)
+            _put(win, 2, 0, counts.ljust(w), curses.A_NORMAL, w)
         except curses.error:
             pass
 
-        err_attr = curses.color_pair(5)
+        err_attr = self.cp_error
         if self.m.errors:
-            last_errors = self.m.errors[-2:]
+            last_errors = list(self.m.errors)[-2:]
             msg = "  ".join(last_errors)
             try:
-                win.addnstr(3, 0, msg[:w], w, err_attr)
+                _put(win, 3, 0, msg, err_attr, w)
             except curses.error:
                 pass
         else:
             try:
-                win.addnstr(3, 0, " ".ljust(w), w, curses.A_NORMAL)
+                _put(win, 3, 0, " ".ljust(w), curses.A_NORMAL, w)
             except curses.error:
                 pass
 
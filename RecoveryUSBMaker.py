@@ -16,18 +16,41 @@
 
 import sys
 import os
+import errno
+import re
+import ctypes
 import shutil
 import subprocess
+import tempfile
 import xml.etree.ElementTree as ET
 import threading
 import queue
 import curses
+from collections import deque, namedtuple
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # --- Global Constants ---
 
 IMZ_PW_CHARS = "k`gybs0vampjd" # Magic Code, from Lenovo Think Community, I don't know what it is :>
 
+class ImzPasswordTable(dict):
+    """str.translate table for one position phase (i % 3) of the IMZ password cipher."""
+
+    def __init__(self, phase):
+        super().__init__()
+        self.phase = phase
+        for code in range(256): # Latin-1 precomputed
+            self.__missing__(code)
+
+    def __missing__(self, code):
+        # Any other character is computed once on first use
+        ciphered = self[code] = ord(IMZ_PW_CHARS[code % 13]) - self.phase + 2
+        return ciphered
+
+IMZ_PW_TABLES = tuple(ImzPasswordTable(phase) for phase in range(3))
+
 # Application Metadata for Title Bar
 APP_TITLE = "Think Recovery USB Maker Advanced"
 APP_AUTHOR = "Kenzo Love Yuki"
@@ -45,8 +68,57 @@ INPUT_FIELDS = [
     ("3. Patch Source Directory (Optional):", "patch_dir", DEFAULT_PATCH),
     ("4. Target USB Directory:", "target_dir", DEFAULT_TARGET)
 ]
+# Column views of INPUT_FIELDS, so the draw and edit paths index one flat tuple
+INPUT_FIELD_LABELS, INPUT_FIELD_KEYS, INPUT_FIELD_DEFAULTS = zip(*INPUT_FIELDS)
+INPUT_LABEL_WIDTH = max(len(label) for label in INPUT_FIELD_LABELS)
 NUM_INPUTS = len(INPUT_FIELDS)
 ACTION_DONE_TOKEN = "PROCESS_DONE" # Unique token to signal thread completion
+# Log table row: Action, Filename, Target Path, Result. The .25 precision cuts long
+# filenames/paths inside the same format call that pads them.
+LOG_FMT = "{:<8} {:<25.25} {:<25.25} {:<20}".format
+LOG_PAD_ROWS = 256 # Initial log pad height, doubled as the log grows
+LOG_KEEP_ROWS = 2048 # Newest log lines kept; older ones drop off the top of the panel
+IDLE_POLL_MS = -1 # Block in getch when nothing is running: only a key can change the screen
+RUNNING_POLL_MS = 50 # getch wait while the worker logs, so the queue is pumped often
+LOG_DRAIN_MAX = 256 # Log lines taken from the queue per tick, the rest wait for the next one
+LOG_QUEUE_MAX = 4096 # Log records buffered between the workers and the UI
+LOG_PUT_TIMEOUT = 0.1 # How long a worker waits on a full log queue before dropping the record
+PROGRESS_QUEUE_MAX = 16 # (stage, percent) heartbeats; only the newest one is shown
+MAX_WORKERS = min(8, os.cpu_count() or 1) # Parallel copy/unpack jobs
+COPY_BUFFER_SIZE = 1024 * 1024 # User-space copy chunk, for multi-GB recovery images
+
+# ARM CRI detection: "ARM" plus an OS/PLATFORM mention anywhere, case-insensitive
+CRI_SCAN_CHUNK = 64 * 1024
+CRI_ARM_RE = re.compile(rb'ARM', re.I)
+CRI_ARM_CONTEXT_RE = re.compile(rb'OS|PLATFORM', re.I)
+
+# One RMF <file> entry, resolved once at parse time.
+# copypath is stripped of slashes; final_name is name, or the source basename if unnamed.
+FilePlan = namedtuple('FilePlan', 'source copy copypath key name final_name fcontent')
+
+class LogQueue(queue.Queue):
+    """
+    Bounded worker -> UI log channel. put_log gives up on a record if the queue stays full
+    for LOG_PUT_TIMEOUT, so a stalled UI can't block the copy jobs; dropped records are counted.
+    """
+
+    def __init__(self, maxsize=LOG_QUEUE_MAX):
+        super().__init__(maxsize)
+        self.dropped = 0
+        self.dropped_lock = threading.Lock()
+
+    def put_log(self, record):
+        try:
+            self.put(record, timeout=LOG_PUT_TIMEOUT)
+        except queue.Full:
+            with self.dropped_lock:
+                self.dropped += 1
+
+    def take_dropped(self):
+        """Returns the number of records dropped since the last call."""
+        with self.dropped_lock:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
 
 # --- Core Logic / Helper Functions ---
 
@@ -57,22 +129,232 @@ def encrypt_imz_password(clear_password):
     if not clear_password:
         return ""
     
-    ciphered_chars = []
-    for i in range(len(clear_password)):
-        clear_char = clear_password[i]
-        char_index = ord(clear_char) % 13
-        pwchars_char = IMZ_PW_CHARS[char_index]
-        ciphered_ordinal = ord(pwchars_char) - (i % 3) + 2
-        ciphered_char = chr(ciphered_ordinal)
-        ciphered_chars.append(ciphered_char)
+    # Each char is shifted by its position mod 3, so translate the three strides separately
+    ciphered_chars = list(clear_password)
+    for phase, table in enumerate(IMZ_PW_TABLES):
+        ciphered_chars[phase::3] = clear_password[phase::3].translate(table)
 
     return "".join(ciphered_chars)
 
-def post_process_files(recovery_target, patch_source, script_dir, log_queue):
-    """Handles rename, EFI overwrite, and AOD rebuilding."""
+def fast_copy(src, dst):
+    """
+    Copies src to dst (a file path or a directory) with metadata, like shutil.copy2,
+    but leaves the data transfer to the OS: CopyFileW on Windows, sendfile elsewhere.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        # Opening dst for writing would truncate src
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+    if os.name == 'nt':
+        if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            raise ctypes.WinError()
+    else:
+        with open(src, 'rb') as f_src, open(dst, 'wb') as f_dst:
+            size = os.fstat(f_src.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(f_dst.fileno(), f_src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (AttributeError, OSError) as e:
+                # No sendfile between regular files on this platform, copy in user space
+                if offset or getattr(e, 'errno', None) not in (None, errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK):
+                    raise
+                shutil.copyfileobj(f_src, f_dst, COPY_BUFFER_SIZE)
+
+    shutil.copystat(src, dst)
+    return dst
+
+def replace_if_exists(src, dst):
+    """os.replace that returns False instead of raising when src is missing."""
+    try:
+        os.replace(src, dst)
+    except FileNotFoundError:
+        return False
+    return True
+
+def job_lane(relpath):
+    """
+    Serial lane for a job writing at relpath under the target dir: its top-level folder or
+    file name. None means the target dir itself, which overlaps every other lane.
+    """
+    relpath = os.path.normcase(os.path.normpath(relpath))
+    if relpath == os.curdir:
+        return None
+    return relpath.split(os.sep, 1)[0]
+
+def run_job_lane(jobs, finished):
+    """
+    Runs (func, args) jobs from the jobs queue in order until a None marker.
+    Puts True on finished after each job, and None once the lane ends, even if a job raised.
+    """
+    try:
+        for job, args in iter(jobs.get, None):
+            job(*args)
+            finished.put(True)
+    finally:
+        finished.put(None)
+
+def copy_file(source_file, source_full_path, target_full_path, copypath_rel, log_queue):
+    """Copies a single source file into the target tree and logs the result."""
+    try:
+        fast_copy(source_full_path, target_full_path)
+        result = "Success"
+    except Exception as e:
+        result = f"Error: {e}"
+    log_queue.put_log(("COPY", source_file, copypath_rel, result))
+
+def unpack_archives(archives, target_subdir, password, log_queue):
+    """
+    Extracts several archives sharing one target dir and password with a single 7z call.
+    archives is a list of (source_file, source_full_path, copypath_rel) tuples.
+    """
+
+    def log(action, filename, path, result):
+        log_queue.put_log((action, filename, path, result))
+
+    archive_entries = {os.path.normcase(full_path): (source_file, copypath_rel)
+                       for source_file, full_path, copypath_rel in archives}
+
+    def run_7z(extra_args):
+        """
+        Runs 7z, streaming its stdout so each archive is logged as it starts.
+        Returns (returncode, last error line).
+        """
+        cmd = ['7z', 'x'] + extra_args + [f'-o{target_subdir}', '-y']
+        if password:
+            cmd.append(f'-p{password}')
+
+        last_line = ""
+        # stderr goes to a temp file so a chatty 7z can't block on a full pipe
+        with tempfile.TemporaryFile() as err_file:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err_file,
+                                    text=True, encoding='utf-8', errors='replace')
+            with proc.stdout:
+                for line in proc.stdout:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    last_line = line
+                    if line.startswith('Extracting archive: '):
+                        entry = archive_entries.get(os.path.normcase(line[20:]))
+                        if entry:
+                            log("UNPACK", entry[0], entry[1], "Extracting...")
+            returncode = proc.wait()
+            err_file.seek(0)
+            error_text = err_file.read().decode('utf-8', 'replace')
+
+        return returncode, (error_text.strip().split('\n')[-1] if error_text else last_line)
+
+    try:
+        if len(archives) > 1:
+            # One process for the whole bucket, archive names passed through a listfile
+            list_fd, list_path = tempfile.mkstemp(suffix='.lst', text=True)
+            try:
+                with os.fdopen(list_fd, 'w', encoding='utf-8') as f:
+                    f.writelines(full_path + '\n' for _, full_path, _ in archives)
+                returncode, _ = run_7z(['-an', f'-ai@{list_path}', '-scsUTF-8', '-bb1'])
+            finally:
+                os.remove(list_path)
+
+            if returncode == 0:
+                for source_file, _, copypath_rel in archives:
+                    log("UNPACK", source_file, copypath_rel, "Success")
+                return
+            # Batch failed: redo each archive on its own so every file gets its own result
+
+        for source_file, source_full_path, copypath_rel in archives:
+            try:
+                returncode, error_output = run_7z([source_full_path])
+                if returncode == 0:
+                    log("UNPACK", source_file, copypath_rel, "Success")
+                else:
+                    log("UNPACK", source_file, copypath_rel, f"Fail ({error_output})")
+            except FileNotFoundError:
+                raise
+            except Exception as e:
+                log("UNPACK", source_file, "", f"Exception: {e}")
+    except FileNotFoundError:
+        log("UNPACK", "7z.exe", "", "Not Found in Path")
+    except Exception as e:
+        log("UNPACK", target_subdir, "", f"Exception: {e}")
+
+def is_arm_cri(cri_path):
+    """Scans a CRI file in chunks and stops as soon as both ARM markers are seen."""
+    found_arm = found_context = False
+    tail = b""
+    with open(cri_path, 'rb') as f:
+        while True:
+            chunk = f.read(CRI_SCAN_CHUNK)
+            if not chunk:
+                return False
+            # Keep a few bytes of the previous chunk so a marker split across chunks still matches
+            window = tail + chunk
+            found_arm = found_arm or CRI_ARM_RE.search(window) is not None
+            found_context = found_context or CRI_ARM_CONTEXT_RE.search(window) is not None
+            if found_arm and found_context:
+                return True
+            tail = window[-7:]
+
+def find_patch_cri(patch_source, log_queue):
+    """
+    Picks the first non-ARM CRI in patch_source that has a matching .IMZ.
+    Returns (cri_filename, cri_path, imz_path), or None if there is none.
+    Only reads patch_source, so it can run while the recovery files are being unpacked.
+    """
+
+    def log(action, filename, path, result):
+        log_queue.put_log((action, filename, path, result))
+
+    if not (patch_source and os.path.exists(patch_source)):
+        return None
+
+    try:
+        # One directory scan; IMZ files are indexed by upper-case name for the pair lookup
+        with os.scandir(patch_source) as it:
+            patch_entries = [entry for entry in it if entry.is_file()]
+        imz_paths = {}
+        for entry in patch_entries:
+            if entry.name.upper().endswith('.IMZ'):
+                imz_paths.setdefault(entry.name.upper(), entry.path)
+
+        for entry in patch_entries:
+            filename = entry.name
+            if filename.lower().endswith('.cri'):
+                cri_path = entry.path
+                
+                # Basic check to filter out ARM based CRI (simple text search)
+                is_arm = False
+                try:
+                    is_arm = is_arm_cri(cri_path)
+                except: pass
+                
+                if is_arm:
+                    log("SKIP", filename, "", "ARM Architecture detected")
+                    continue
+
+                # Find corresponding IMZ
+                base_name = os.path.splitext(filename)[0]
+                imz_path = imz_paths.get(base_name.upper() + '.IMZ')
+
+                if imz_path:
+                    return filename, cri_path, imz_path # Only process the first valid pair
+    except Exception as e:
+        log("COPY", "CRI/IMZ", "", f"Error: {e}")
+    return None
+
+def post_process_files(recovery_target, patch_source, patch_cri, script_dir, log_queue):
+    """
+    Handles rename, EFI overwrite, and AOD rebuilding.
+    patch_cri is the CRI/IMZ pair returned by find_patch_cri (or None).
+    """
     
     def log(action, filename, path, result):
-        log_queue.put({"action": action, "filename": filename, "path": path, "result": result})
+        log_queue.put_log((action, filename, path, result))
 
     copied_cri_name = None
         
@@ -80,8 +362,7 @@ def post_process_files(recovery_target, patch_source, script_dir, log_queue):
     try:
         old_path = os.path.join(recovery_target, 'MFG')
         new_path = os.path.join(recovery_target, 'mfg')
-        if os.path.isdir(old_path):
-            os.rename(old_path, new_path)
+        if replace_if_exists(old_path, new_path):
             log("MODIFY", "Folder MFG", "root", "Renamed to 'mfg'")
     except Exception as e:
         log("MODIFY", "Folder MFG", "", f"Error: {e}")
@@ -104,35 +385,12 @@ def post_process_files(recovery_target, patch_source, script_dir, log_queue):
             target_rec_dir = os.path.join(recovery_target, 'RECOVERY')
             os.makedirs(target_rec_dir, exist_ok=True)
             
-            patch_files = os.listdir(patch_source)
-            for filename in patch_files:
-                if filename.lower().endswith('.cri'):
-                    cri_path = os.path.join(patch_source, filename)
-                    
-                    # Basic check to filter out ARM based CRI (simple text search)
-                    is_arm = False
-                    try:
-                        with open(cri_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read().upper()
-                        if "ARM" in content and ("OS" in content or "PLATFORM" in content):
-                            is_arm = True
-                    except: pass
-                    
-                    if is_arm:
-                        log("SKIP", filename, "", "ARM Architecture detected")
-                        continue
-
-                    # Find corresponding IMZ
-                    base_name = os.path.splitext(filename)[0]
-                    imz_filename = base_name + '.IMZ'
-                    imz_path = os.path.join(patch_source, imz_filename)
-
-                    if os.path.exists(imz_path):
-                        shutil.copy2(cri_path, target_rec_dir)
-                        shutil.copy2(imz_path, target_rec_dir)
-                        copied_cri_name = filename
-                        log("COPY", f"{filename} & .IMZ", "RECOVERY", "Copied from Patch")
-                        break # Only process the first valid pair
+            if patch_cri:
+                filename, cri_path, imz_path = patch_cri
+                fast_copy(cri_path, target_rec_dir)
+                fast_copy(imz_path, target_rec_dir)
+                copied_cri_name = filename
+                log("COPY", f"{filename} & .IMZ", "RECOVERY", "Copied from Patch")
         except Exception as e:
             log("COPY", "CRI/IMZ", "", f"Error: {e}")
 
@@ -143,11 +401,9 @@ def post_process_files(recovery_target, patch_source, script_dir, log_queue):
         aod_org = os.path.join(target_rec_dir, 'AOD.ORG')
         aod_stat = os.path.join(target_rec_dir, 'aodstat.dat')
 
-        if os.path.exists(aod_dat):
-            try:
-                # Rename DAT -> ORG
-                os.rename(aod_dat, aod_org)
-                
+        try:
+            # Rename DAT -> ORG; no AOD.DAT in the recovery means nothing to rebuild
+            if replace_if_exists(aod_dat, aod_org):
                 # Run aodbuild
                 aodbuild_exe = os.path.join(script_dir, 'aodbuild.exe')
                 if not os.path.exists(aodbuild_exe):
@@ -163,112 +419,180 @@ def post_process_files(recovery_target, patch_source, script_dir, log_queue):
                     log("EXEC", "aodbuild.exe", "", f"Fail: {proc.stderr}")
 
                 # Rename aodstat.dat -> AOD.DAT
-                if os.path.exists(aod_stat):
-                    os.rename(aod_stat, aod_dat)
-                    
-                    # Splice Header
-                    with open(aod_org, 'r', encoding='utf-8') as f_org:
-                        header_lines = [next(f_org) for _ in range(4)]
-                    with open(aod_dat, 'r', encoding='utf-8') as f_dat:
-                        content_lines = f_dat.readlines()
-                    
-                    content_lines[:4] = header_lines
-                    final_lines = [line for line in content_lines if line.strip()]
-                    
-                    with open(aod_dat, 'w', encoding='utf-8') as f_out:
-                        f_out.writelines(final_lines)
+                if replace_if_exists(aod_stat, aod_dat):
+                    # Splice Header: stream ORG header + DAT body (minus its header) into a temp file
+                    tmp_fd, tmp_path = tempfile.mkstemp(dir=target_rec_dir, suffix='.tmp')
+                    try:
+                        with os.fdopen(tmp_fd, 'w', encoding='utf-8') as f_out, \
+                             open(aod_org, 'r', encoding='utf-8') as f_org, \
+                             open(aod_dat, 'r', encoding='utf-8') as f_dat:
+                            header_lines = [next(f_org) for _ in range(4)]
+                            f_out.writelines(line for line in header_lines if line.strip())
+                            f_out.writelines(line for line in islice(f_dat, 4, None) if line.strip())
+                        os.replace(tmp_path, aod_dat)
+                    except BaseException:
+                        os.remove(tmp_path)
+                        raise
                         
                     log("MODIFY", "AOD.DAT", "RECOVERY", "Header updated & Cleaned")
                 else:
                     log("ERROR", "aodstat.dat", "", "Not generated by aodbuild")
 
-            except Exception as e:
-                log("ERROR", "AOD Processing", "", str(e))
+        except Exception as e:
+            log("ERROR", "AOD Processing", "", str(e))
     
-    log_queue.put({"action": "STATUS", "filename": "", "path": "", "result": "Post-processing complete."})
+    log_queue.put_log(("STATUS", "", "", "Post-processing complete."))
 
 
+def load_rmf_plan(rmf_path):
+    """
+    Streams the RMF into a plan: {"manualfiles": [...], "files": [...]}.
+    Entries are FilePlan tuples, and a missing section is None.
+    Only the first <recovery> node and its first sections are read.
+    Returns None if the RMF has no <recovery> node.
+    """
+    plan = None
+    in_recovery = False
+    section = None # Entry list of the section currently being read
+    depth = 0
+
+    for event, elem in ET.iterparse(rmf_path, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 2 and elem.tag == 'recovery' and plan is None:
+                plan = {"manualfiles": None, "files": None}
+                in_recovery = True
+            elif depth == 3 and in_recovery and plan.get(elem.tag, []) is None:
+                section = plan[elem.tag] = []
+            continue
+
+        if depth == 4 and section is not None and elem.tag == 'file':
+            attrib = elem.attrib
+            source = attrib.get('source')
+            name = attrib.get('name')
+            fcontent_node = elem.find('fcontent')
+            section.append(FilePlan(
+                source=source,
+                copy=attrib.get('copy'),
+                copypath=attrib.get('copypath', '').strip('/\\'),
+                key=attrib.get('key'),
+                name=name,
+                final_name=name or (os.path.basename(source) if source else None),
+                fcontent=fcontent_node.text if fcontent_node is not None else None,
+            ))
+        elif depth == 3:
+            section = None
+        elif depth == 2:
+            in_recovery = False
+
+        # Drop finished subtrees so memory stays flat on large RMFs
+        if depth <= 4:
+            elem.clear()
+        depth -= 1
+
+    return plan
+
 def parse_rmf_for_dialog(rmf_path, log_queue):
     """Parses RMF for basic info and extracts VALUES.TXT content."""
     
     def log(action, filename, path, result):
-        log_queue.put({"action": action, "filename": filename, "path": path, "result": result})
+        log_queue.put_log((action, filename, path, result))
         
     try:
         if not os.path.exists(rmf_path):
             log("ERROR", os.path.basename(rmf_path), "", "RMF file not found.")
             return None, None
             
-        tree = ET.parse(rmf_path)
-        root = tree.getroot()
-        recovery_node = root.find('recovery')
-        if recovery_node is None:
+        plan = load_rmf_plan(rmf_path)
+        if plan is None:
             log("ERROR", os.path.basename(rmf_path), "", "Node 'recovery' not found in RMF.")
             return None, None
             
-        manualfiles_node = recovery_node.find('manualfiles')
-        if manualfiles_node is None:
-            return root, None # No manual files, proceed without dialog
+        manual_files = plan["manualfiles"]
+        if manual_files is None:
+            return plan, None # No manual files, proceed without dialog
+
+        # First VALUES.TXT entry that carries content, without scanning the rest
+        values_entry = next((file_entry for file_entry in manual_files
+                             if file_entry.fcontent and (file_entry.name or '').upper() == 'VALUES.TXT'), None)
 
         values_txt_content = None
-        for file_node in manualfiles_node.findall('file'):
-            if file_node.get('name', '').upper() == 'VALUES.TXT':
-                fcontent_node = file_node.find('fcontent')
-                if fcontent_node is not None and fcontent_node.text:
-                    # Clean up the text content for display
-                    # Format: 0) Name: 	ThinkPad X1 Nano Gen 1\n1) CD#: 	1 of 1...
-                    content = fcontent_node.text.strip()
-                    # Replace tabs and ensure consistent spacing for display
-                    content = content.replace('\t', ' ')
-                    
-                    # Standardize format for display in curses (pad field names)
-                    # The original format has key: value, we just want to preserve the lines
-                    values_txt_content = []
-                    for line in content.split('\n'):
-                        if line.strip():
-                            # Reformat using consistent padding, assuming standard format
-                            try:
-                                key_part, val_part = line.split(':', 1)
-                                # Try to match the original padding requested by the user
-                                formatted_line = f"{key_part.strip():<8}:\t{val_part.strip()}"
-                                values_txt_content.append(formatted_line)
-                            except ValueError:
-                                values_txt_content.append(line.strip())
-                    
-                    values_txt_content = '\n'.join(values_txt_content)
-                    break
-        
-        return root, values_txt_content
+        if values_entry is not None:
+            fcontent = values_entry.fcontent
+            # Clean up the text content for display
+            # Format: 0) Name: 	ThinkPad X1 Nano Gen 1\n1) CD#: 	1 of 1...
+            content = fcontent.strip()
+            # Replace tabs and ensure consistent spacing for display
+            content = content.replace('\t', ' ')
+            
+            # Standardize format for display in curses (pad field names)
+            # The original format has key: value, we just want to preserve the lines
+            values_txt_content = []
+            for line in content.split('\n'):
+                if line.strip():
+                    # Reformat using consistent padding, assuming standard format
+                    try:
+                        key_part, val_part = line.split(':', 1)
+                        # Try to match the original padding requested by the user
+                        formatted_line = f"{key_part.strip():<8}:\t{val_part.strip()}"
+                        values_txt_content.append(formatted_line)
+                    except ValueError:
+                        values_txt_content.append(line.strip())
+            
+            values_txt_content = '\n'.join(values_txt_content)
+
+        return plan, values_txt_content
         
     except Exception as e:
         log("ERROR", os.path.basename(rmf_path), "", f"XML Parse Fail: {str(e)}")
         return None, None
 
 
-def run_recovery_process(rmf_root, source_dir, patch_dir, target_dir, log_queue):
-    """The main logic running in a background thread. Uses pre-parsed RMF root."""
+def run_recovery_process(rmf_plan, source_dir, patch_dir, target_dir, log_queue, progress_queue=None, done_event=None):
+    """
+    The main logic running in a background thread. Uses the pre-parsed RMF plan.
+    Progress goes to progress_queue as (stage, percent or None), apart from the log text.
+    done_event is set once everything, including the done token, has been queued.
+    """
     script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
 
     def log(action, filename, path, result):
-        log_queue.put({"action": action, "filename": filename, "path": path, "result": result})
+        log_queue.put_log((action, filename, path, result))
+
+    def progress(stage, percent=None):
+        if progress_queue is None:
+            return
+        try:
+            progress_queue.put_nowait((stage, percent))
+        except queue.Full:
+            pass # UI is behind; a later heartbeat supersedes this one
+
+    # Top-level names of source_dir, listed once instead of one exists() per RMF entry
+    try:
+        with os.scandir(source_dir) as it:
+            source_names = {os.path.normcase(entry.name) for entry in it if entry.is_file() or entry.is_dir()}
+    except OSError:
+        source_names = None
+
+    def source_exists(source_file, source_full_path):
+        if source_names is None or os.path.dirname(source_file):
+            return os.path.exists(source_full_path)
+        return os.path.normcase(source_file) in source_names
         
     try:
         # 1. Create Target Directory
         os.makedirs(target_dir, exist_ok=True)
         log("INIT", "Target Dir", target_dir, "Created/Verified")
 
-        # Use the pre-parsed root
-        recovery_node = rmf_root.find('recovery')
-
         # 2. Handle 'manualfiles' (CREATE)
-        manualfiles_node = recovery_node.find('manualfiles')
-        if manualfiles_node is not None:
-            for file_node in manualfiles_node.findall('file'):
-                filename = file_node.get('name')
-                copypath_rel = file_node.get('copypath', '').strip('/\\')
-                fcontent_node = file_node.find('fcontent')
+        manual_files = rmf_plan["manualfiles"]
+        if manual_files is not None:
+            for file_entry in manual_files:
+                filename = file_entry.name
+                copypath_rel = file_entry.copypath
+                fcontent = file_entry.fcontent
                 
-                if filename and fcontent_node is not None and fcontent_node.text:
+                if filename and fcontent:
                     full_target_path = os.path.join(target_dir, copypath_rel, filename)
                     os.makedirs(os.path.dirname(full_target_path), exist_ok=True)
                     try:
@@ -278,7 +602,7 @@ def run_recovery_process(rmf_root, source_dir, patch_dir, target_dir, log_queue)
                             log_msg = "Content Verified (Written)"
                             
                         with open(full_target_path, 'w', encoding='utf-8') as f:
-                            f.write(fcontent_node.text.strip())
+                            f.write(fcontent.strip())
                         
                         log("CREATE", filename, copypath_rel, log_msg)
 
@@ -286,73 +610,137 @@ def run_recovery_process(rmf_root, source_dir, patch_dir, target_dir, log_queue)
                         log("CREATE", filename, copypath_rel, f"Error: {e}")
 
         # 3. Handle 'files' (COPY / UNPACK)
-        files_node = recovery_node.find('files')
-        if files_node is not None:
-            all_files = files_node.findall('file')
-            for file_node in all_files:
-                source_file = file_node.get('source')
-                if not source_file: continue
-
-                copy_action = file_node.get('copy')
-                copypath_rel = file_node.get('copypath', '').strip('/\\')
-                key = file_node.get('key')
-                name = file_node.get('name')
-                
-                final_name = name if name else os.path.basename(source_file)
-                source_full_path = os.path.join(source_dir, source_file)
-                target_subdir = os.path.join(target_dir, copypath_rel)
-
-                os.makedirs(target_subdir, exist_ok=True)
-
-                if not os.path.exists(source_full_path):
-                    log("MISSING", source_file, "", "Source not found")
-                    continue
-
-                if copy_action == '1':
-                    # Copy
-                    target_full_path = os.path.join(target_subdir, final_name)
-                    try:
-                        shutil.copy2(source_full_path, target_full_path)
-                        log("COPY", source_file, copypath_rel, "Success")
-                    except Exception as e:
-                        log("COPY", source_file, copypath_rel, f"Error: {e}")
-
-                elif copy_action == '0':
-                    # Unpack (7z)
-                    password = encrypt_imz_password(key)
-                    cmd = ['7z', 'x', source_full_path, f'-o{target_subdir}', '-y']
-                    if password:
-                        cmd.append(f'-p{password}')
-                    
-                    try:
-                        proc = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-                        if proc.returncode == 0:
-                            log("UNPACK", source_file, copypath_rel, "Success")
+        all_files = rmf_plan["files"]
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # The patch CRI scan only reads patch_dir, so it overlaps the copies and unpacks.
+            # Everything post-processing writes (EFI, CRI/IMZ, AOD) must land on top of
+            # the extracted files, so it still waits for the pool.
+            patch_cri_future = executor.submit(find_patch_cri, patch_dir, log_queue)
+
+            if all_files is not None:
+                # Jobs under the same top-level target folder can overwrite each other's files,
+                # so they share a lane: one pool task running them from a queue in RMF order.
+                # A lane starts with its first job, so copies run while the RMF is still being
+                # walked, and lanes run side by side. An unpack into the target root can write
+                # anywhere, so the lanes before it are ended and waited for, and its own lane is
+                # waited for before any other starts.
+                # Archives that follow one another in a lane with the same target and password
+                # share one 7z call; the group is held back until another job or the lane's end.
+                finished = queue.Queue() # run_job_lane reports finished jobs and ended lanes here
+                lanes = {} # lane -> [job queue, future, held unpack group or None]
+                lane_futures = []
+                job_count = 0
+
+                def end_lanes(names):
+                    """Queues each lane's held unpack group and end marker; returns their futures."""
+                    futures = []
+                    for name in names:
+                        jobs, future, group = lanes.pop(name)
+                        if group is not None:
+                            jobs.put(group)
+                        jobs.put(None)
+                        futures.append(future)
+                    return futures
+
+                progress("Copy/Unpack", 0)
+                created_dirs = set()
+                try:
+                    for file_entry in all_files:
+                        source_file = file_entry.source
+                        if not source_file: continue
+
+                        copypath_rel = file_entry.copypath
+                        source_full_path = os.path.join(source_dir, source_file)
+                        target_subdir = os.path.join(target_dir, copypath_rel)
+
+                        if target_subdir not in created_dirs:
+                            os.makedirs(target_subdir, exist_ok=True)
+                            created_dirs.add(target_subdir)
+
+                        if not source_exists(source_file, source_full_path):
+                            log("MISSING", source_file, "", "Source not found")
+                            continue
+
+                        if file_entry.copy == '1':
+                            lane = job_lane(os.path.join(copypath_rel, file_entry.final_name))
                         else:
-                            error_output = (proc.stderr or proc.stdout).strip().split('\n')[-1]
-                            log("UNPACK", source_file, copypath_rel, f"Fail ({error_output})")
-                    except FileNotFoundError:
-                        log("UNPACK", "7z.exe", "", "Not Found in Path")
-                    except Exception as e:
-                        log("UNPACK", source_file, "", f"Exception: {e}")
+                            lane = job_lane(copypath_rel)
+                        if lane is None:
+                            overlapping = [name for name in lanes if name is not None]
+                        else:
+                            overlapping = [None] if None in lanes else []
+                        for future in end_lanes(overlapping):
+                            future.result()
+                        if lane not in lanes:
+                            jobs = queue.Queue()
+                            future = executor.submit(run_job_lane, jobs, finished)
+                            lanes[lane] = [jobs, future, None]
+                            lane_futures.append(future)
+                        jobs, _, group = lanes[lane]
+
+                        if file_entry.copy == '1':
+                            # Copy, after any group held for this lane
+                            if group is not None:
+                                jobs.put(group)
+                                lanes[lane][2] = None
+                            target_full_path = os.path.join(target_subdir, file_entry.final_name)
+                            jobs.put((copy_file, (
+                                source_file, source_full_path, target_full_path, copypath_rel, log_queue)))
+                            job_count += 1
+
+                        elif file_entry.copy == '0':
+                            # Unpack (7z), joining the held group if it is for this dir and password
+                            password = encrypt_imz_password(file_entry.key)
+                            if group is None or group[1][1:3] != (target_subdir, password):
+                                if group is not None:
+                                    jobs.put(group)
+                                group = lanes[lane][2] = (unpack_archives, ([], target_subdir, password, log_queue))
+                                job_count += 1
+                            group[1][0].append((source_file, source_full_path, copypath_rel))
+                finally:
+                    end_lanes(list(lanes)) # Even on an error, so no lane waits forever
+
+                # Each lane reports True per finished job, then None when it ends
+                done = 0
+                for _ in lane_futures:
+                    while finished.get():
+                        done += 1
+                        progress("Copy/Unpack", done * 100 // job_count)
+                for future in lane_futures:
+                    future.result()
+
+            patch_cri = patch_cri_future.result()
 
         # 4. Post-Processing
-        post_process_files(target_dir, patch_dir, script_dir, log_queue)
+        progress("Post-processing")
+        post_process_files(target_dir, patch_dir, patch_cri, script_dir, log_queue)
 
         log("STATUS", "", "", "Recovery Creation Completed!")
 
     except Exception as e:
          log("FATAL", "Main Loop", "", str(e))
     finally:
-        log_queue.put({"action": ACTION_DONE_TOKEN, "filename": "", "path": "", "result": "Finished"})
+        log_queue.put(ACTION_DONE_TOKEN) # Never dropped: the UI waits for it
+        if done_event is not None:
+            done_event.set()
 
 
 # --- Curses UI Functions ---
 
-def draw_title_bar(stdscr, max_width):
-    """Draws the fixed title bar at the top."""
+def draw_title_bar(stdscr, max_width, progress=None):
+    """Draws the fixed title bar at the top, with the worker's (stage, percent) progress on the right."""
     title_text = f" {APP_TITLE} | Written By: {APP_AUTHOR} | Version: {APP_VERSION} "
-    stdscr.addstr(0, 0, title_text.ljust(max_width)[:max_width], curses.A_REVERSE | curses.A_BOLD)
+    title_attr = curses.A_REVERSE | curses.A_BOLD
+    # Padded to the full width so the bar is filled without clrtoeol, which would clear
+    # row 1 once a title as wide as the terminal has wrapped the cursor there
+    stdscr.addnstr(0, 0, title_text.ljust(max_width), max_width, title_attr)
+
+    if progress:
+        stage, percent = progress
+        progress_text = f" {stage} {percent}% " if percent is not None else f" {stage}... "
+        progress_col = max_width - len(progress_text)
+        if progress_col > len(title_text): # Only if it fits next to the title
+            stdscr.addstr(0, progress_col, progress_text, title_attr)
 
 
 def show_modal_dialog(stdscr, title, message, prompt="Proceed?", default_yes=True):
@@ -395,7 +783,7 @@ def show_modal_dialog(stdscr, title, message, prompt="Proceed?", default_yes=Tru
         for i, line in enumerate(message_lines):
             try:
                 # Truncate lines that are too long for the modal window
-                modal_win.addstr(i + 2, 2, line[:win_w - 4])
+                modal_win.addnstr(i + 2, 2, line, win_w - 4)
             except curses.error:
                 pass
 
@@ -440,88 +828,39 @@ def show_modal_dialog(stdscr, title, message, prompt="Proceed?", default_yes=Tru
 
 
 def draw_input_panel(stdscr, input_values, focus_index, max_width):
-    """Draws all input fields and labels."""
+    """Draws all input fields and labels. Cursor visibility is left to the caller."""
     # Note: input_win now starts at Y=1 due to the Title Bar
     
     # Calculate padding for inputs
-    label_width = max(len(label) for label, _, _ in INPUT_FIELDS)
-    input_start_col = label_width + 4
+    input_start_col = INPUT_LABEL_WIDTH + 4
     input_width = max_width - input_start_col - 2
-    
-    # Hide cursor initially
-    curses.curs_set(0)
-
-    for i, (label, key, _) in enumerate(INPUT_FIELDS):
-        row = i * 2 + 1
-        
-        # Draw label
-        stdscr.addstr(row, 2, label)
-        
-        value = input_values.get(key, "")
-        display_value = value
-        attr = curses.A_NORMAL
-        
-        # Draw input box
-        if i == focus_index:
-            attr = curses.A_REVERSE | curses.A_BOLD
-            curses.curs_set(1) # Show cursor when in an input field
-            cursor_pos = len(value)
-            
-            # Logic to visually scroll the input field if the path is too long
-            display_start = max(0, cursor_pos - input_width + 1)
-            display_value = value[display_start:display_start + input_width]
-            
-            # Move cursor to the actual display position
-            stdscr.move(row, input_start_col + (cursor_pos - display_start))
-        else:
-            # If not focused, display the start of the path (or the whole path if short enough)
-            display_value = value[:input_width]
-            
-        # Draw the text content
-        # Note: The input panel window is no longer used, drawing directly to stdscr starting at Y=1
-        # The coordinates are relative to the top of the input area (which is Y=1)
-        
-        # Redraw borders for the configuration area (Y=1 to Y=input_h-1)
-        # Note: The main loop handles the window setup now, using the main screen (stdscr) for the input area
 
-        try:
-            # We are drawing directly to the sub-window, which is why we need to use its coordinates
-            # input_win drawing is managed inside main() now.
-            pass
-        except curses.error:
-            pass
-        
-    # Redrawing inputs in the input_win, which starts at Y=1 relative to stdscr.
-    
-    # Redrawing input panel border and title using the passed stdscr (which is input_win's parent in concept)
-    # The actual window structure is a bit complex, let's stick to using the actual input_win for drawing.
-    # The draw_input_panel is called with `input_win` in main, so it should draw correctly relative to that window's origin (0,0).
     stdscr.erase()
     stdscr.border(0)
     stdscr.addstr(0, 2, " Configuration ", curses.A_BOLD)
 
-    for i, (label, key, _) in enumerate(INPUT_FIELDS):
+    for i, (label, key) in enumerate(zip(INPUT_FIELD_LABELS, INPUT_FIELD_KEYS)):
         row = i * 2 + 1
         
         # Draw label
         stdscr.addstr(row, 2, label)
         
-        value = input_values.get(key, "")
+        value = input_values[key].decode('utf-8', 'replace')
         display_value = value
         attr = curses.A_NORMAL
         
         if i == focus_index:
             attr = curses.A_REVERSE | curses.A_BOLD
-            curses.curs_set(1) 
             cursor_pos = len(value)
             display_start = max(0, cursor_pos - input_width + 1)
             display_value = value[display_start:display_start + input_width]
-            stdscr.move(row, input_start_col + (cursor_pos - display_start))
+            cursor_yx = (row, input_start_col + (cursor_pos - display_start))
         else:
             display_value = value[:input_width]
             
         stdscr.addstr(row, input_start_col - 1, "[", curses.A_BOLD)
-        stdscr.addstr(row, input_start_col, display_value.ljust(input_width)[:input_width], attr)
+        stdscr.addnstr(row, input_start_col, display_value, input_width, attr)
+        stdscr.chgat(row, input_start_col, input_width, attr) # Highlight the whole box
         stdscr.addstr(row, input_start_col + input_width, "]", curses.A_BOLD)
     
     # Draw button
@@ -532,14 +871,21 @@ def draw_input_panel(stdscr, input_values, focus_index, max_width):
     btn_attr = curses.color_pair(1) | curses.A_BOLD
     if focus_index == NUM_INPUTS:
         btn_attr |= curses.A_REVERSE
-        curses.curs_set(0)
         
     stdscr.addstr(btn_row, btn_start_col, btn_text, btn_attr)
-    stdscr.refresh()
+    if focus_index < NUM_INPUTS:
+        stdscr.move(*cursor_yx) # After every other write, so the cursor stays in the focused field
+    stdscr.noutrefresh()
 
 
-def draw_log_panel(log_win, log_lines, log_scroll_offset):
-    """Draws the log table in a separate window with scroll indicator."""
+def draw_log_panel(log_win, log_pad, log_lines, pad_written, log_scroll_offset):
+    """
+    Draws the log table in a separate window with scroll indicator.
+    log_lines holds the newest (action, filename, path, result) records. Rows live in log_pad and are
+    formatted only when first scrolled into view; pad_written is the set of rows already
+    in the pad, updated in place. The visible part of the pad is then blitted.
+    Only stages the update; the caller flushes it with curses.doupdate().
+    """
     log_win.erase()
     log_win.border(0)
     
@@ -548,18 +894,36 @@ def draw_log_panel(log_win, log_lines, log_scroll_offset):
     win_h, win_w = log_win.getmaxyx()
     content_h = win_h - 3 
 
-    header = "{:<8} {:<25} {:<25} {:<20}".format("Action", "Filename", "Target Path", "Result")
-    log_win.addstr(1, 1, header.ljust(win_w - 2)[:win_w - 2], curses.A_UNDERLINE)
+    header = LOG_FMT("Action", "Filename", "Target Path", "Result")
+    log_win.addnstr(1, 1, header, win_w - 2, curses.A_UNDERLINE)
+    log_win.chgat(1, 1, win_w - 2, curses.A_UNDERLINE)
 
     
-    start_line = log_scroll_offset
-    end_line = min(start_line + content_h, len(log_lines))
-    
-    for i, line in enumerate(log_lines[start_line:end_line]):
-        try:
-            log_win.addstr(i + 2, 1, line.ljust(win_w - 2)[:win_w - 2])
-        except curses.error:
-            pass
+    line_w = max(1, win_w - 2)
+    pad_h, pad_w = log_pad.getmaxyx()
+    if pad_w != line_w:
+        pad_written.clear() # Width changed, lines must be re-cut
+    if pad_w != line_w or pad_h < len(log_lines):
+        log_pad.resize(max(pad_h, min(2 * len(log_lines), LOG_KEEP_ROWS)), line_w)
+    if not pad_written:
+        log_pad.erase()
+
+    # Rows that scroll past without ever being shown are never formatted
+    # Visible records are reached from the nearer end of the deque: the tail while following
+    # the newest lines, so a full log is not walked from its head every frame
+    end = min(len(log_lines), log_scroll_offset + max(0, content_h))
+    if log_scroll_offset <= len(log_lines) - end:
+        visible = zip(range(log_scroll_offset, end), islice(log_lines, log_scroll_offset, end))
+    else:
+        visible = zip(range(end - 1, log_scroll_offset - 1, -1),
+                      islice(reversed(log_lines), len(log_lines) - end, None))
+    for row, record in visible:
+        if row not in pad_written:
+            try:
+                log_pad.addnstr(row, 0, LOG_FMT(*record), line_w)
+            except curses.error:
+                pass
+            pad_written.add(row)
             
     if len(log_lines) > content_h:
         max_scroll = len(log_lines) - content_h
@@ -573,29 +937,18 @@ def draw_log_panel(log_win, log_lines, log_scroll_offset):
         thumb_str = '#'
         log_win.addstr(win_h - 1, 2 + bar_pos, thumb_str, curses.A_REVERSE)
 
-    log_win.refresh()
-
-def format_log(item):
-    """Formats a log dict into a single line string."""
-    action = item.get("action", "")
-    filename = item.get("filename", "")
-    path = item.get("path", "")
-    result = item.get("result", "")
-    
-    log_line = "{:<8} {:<25} {:<25} {:<20}".format(
-        action, 
-        filename[:25], 
-        path[:25], 
-        result
-    )
-    return log_line
+    log_win.noutrefresh()
+    if content_h > 0:
+        top, left = log_win.getbegyx()
+        log_pad.noutrefresh(log_scroll_offset, 0, top + 2, left + 1, top + 1 + content_h, left + line_w)
 
 def main(stdscr):
     """Main curses application loop."""
     
     # 1. Initialize Curses
     curses.curs_set(0) 
-    stdscr.timeout(50) 
+    cursor_visible = 0 # Last value given to curs_set; it is only called again on a change
+    stdscr.timeout(IDLE_POLL_MS) 
     
     if curses.has_colors():
         curses.start_color()
@@ -615,125 +968,206 @@ def main(stdscr):
 
     log_win_h = H - input_h - title_h
     log_win = curses.newwin(log_win_h, W, input_h + title_h, 0)
+    log_pad = curses.newpad(LOG_PAD_ROWS, max(1, W - 2))
     
     # 3. State Management
     focus_index = 0 
     is_running = False
     
-    input_values = {key: default for _, key, default in INPUT_FIELDS}
+    # Field buffers are UTF-8 bytes edited in place (typed keys are ASCII, defaults may not be)
+    input_values = {key: bytearray(default.encode('utf-8', 'surrogateescape'))
+                    for key, default in zip(INPUT_FIELD_KEYS, INPUT_FIELD_DEFAULTS)}
     
-    log_lines = []
+    log_lines = deque(maxlen=LOG_KEEP_ROWS)
+    log_pad_written = set() # log_lines rows already formatted into log_pad
     log_scroll_offset = 0 
     user_scrolled = False 
-    log_queue = queue.Queue() 
+    log_queue = LogQueue()
+    progress_queue = queue.Queue(maxsize=PROGRESS_QUEUE_MAX) # Drained before the log, so it never lags behind it
+    progress = None # Newest (stage, percent) from the worker, shown in the title bar
+    done_event = threading.Event() # Set by the worker when it has finished
+    # Panels needing a redraw: set when their state actually changes, cleared once drawn
+    dirty = {"title": True, "input": True, "log": True}
+    poll_ms = IDLE_POLL_MS # Current getch timeout
+    draining = False # A key just arrived: read the rest of the burst before redrawing
+    log_backlog = False # Last drain hit LOG_DRAIN_MAX, so don't wait for keys
+
+    # Key codes looked up once: the handling below runs for every keystroke
+    key_up, key_down, key_resize = curses.KEY_UP, curses.KEY_DOWN, curses.KEY_RESIZE
+    quit_keys = (ord('q'), ord('Q'))
+    next_keys = (key_down, ord('\t'))
+    enter_keys = (curses.KEY_ENTER, 10, 13)
+    backspace_keys = (curses.KEY_BACKSPACE, 127, 8)
 
     # 4. Main Loop
+    # Each pass: drain worker output (A), draw what changed (B), then wait for a key and
+    # apply it (C). A handled key loops straight back to A and B without waiting, so its
+    # effect reaches the screen in the same pass; the poll wait is only ever spent idle.
     while True:
         try:
-            # A. Draw UI
             H, W = stdscr.getmaxyx()
-            
-            # 0. Draw Title Bar on stdscr
-            draw_title_bar(stdscr, W)
-            
-            # 1. Resize and reposition windows
-            input_win.resize(input_h, W)
-            input_win.mvwin(title_h, 0) # Move below title bar
-            
             log_win_h = H - input_h - title_h
-            log_win.resize(log_win_h, W)
-            log_win.mvwin(input_h + title_h, 0) # Move below input window
             log_content_h = log_win_h - 3
             
-            # 2. Draw content
-            draw_input_panel(input_win, input_values, focus_index, W)
-            draw_log_panel(log_win, log_lines, log_scroll_offset)
-            stdscr.refresh()
-            
-            # B. Process Log Queue (Logging and Auto-scroll)
-            max_scroll = max(0, len(log_lines) - log_content_h)
-            
-            while not log_queue.empty():
-                log_item = log_queue.get_nowait()
-                
-                if log_item["action"] == ACTION_DONE_TOKEN:
-                    is_running = False
-                    log_lines.append(format_log({"action": "STATUS", "filename": "Process", "path": "Execution", "result": "Finished."}))
-                else:
-                    log_lines.append(format_log(log_item))
+            # A. Worker finished: leave the running state now. Its last log lines and the
+            # done token were queued before the event was set, so this pass drains them.
+            if is_running and done_event.is_set():
+                done_event.clear()
+                is_running = False
+                while not progress_queue.empty():
+                    progress_queue.get_nowait() # Heartbeats of the finished run are stale now
+                progress = None
+                dirty["title"] = True
+
+            # Progress heartbeats first: few and small, only the newest one is kept
+            while True:
+                try:
+                    progress = progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                dirty["title"] = True
+
+            # Process Log Queue (Logging and Auto-scroll), a bounded batch before one redraw
+            batch = []
+            for _ in range(LOG_DRAIN_MAX):
+                try:
+                    log_item = log_queue.get_nowait()
+                except queue.Empty:
+                    break
                 
+                if log_item == ACTION_DONE_TOKEN:
+                    log_item = ("STATUS", "Process", "Execution", "Finished.")
+                batch.append(log_item)
+            log_backlog = len(batch) == LOG_DRAIN_MAX
+
+            dropped = log_queue.take_dropped()
+            if dropped:
+                batch.append(("WARNING", "Log", "", f"{dropped} lines dropped (UI busy)"))
+
+            if batch:
+                dirty["log"] = True
+                trimmed = len(log_lines) + len(batch) - LOG_KEEP_ROWS
+                log_lines.extend(batch)
+                if trimmed > 0:
+                    # The oldest rows fell off the front, so every row in the pad moved up
+                    log_pad_written.clear()
+                    log_scroll_offset = max(0, log_scroll_offset - trimmed)
                 if not user_scrolled:
                     log_scroll_offset = max(0, len(log_lines) - log_content_h)
                 
-                log_queue.task_done()
-                max_scroll = max(0, len(log_lines) - log_content_h)
+            max_scroll = max(0, len(log_lines) - log_content_h)
 
+            # B. Draw UI, only the panels whose state changed since the last draw.
+            # Panels only stage their changes; one doupdate writes the frame to the terminal.
+            if not draining and any(dirty.values()):
+                if dirty["title"]:
+                    # Title Bar on stdscr, staged first so the panels below stay on top of it
+                    draw_title_bar(stdscr, W, progress)
+                    stdscr.noutrefresh()
+                    dirty["title"] = False
+                
+                if dirty["log"]:
+                    log_win.resize(log_win_h, W)
+                    log_win.mvwin(input_h + title_h, 0) # Move below input window
+                    draw_log_panel(log_win, log_pad, log_lines, log_pad_written, log_scroll_offset)
+                    if not dirty["input"]:
+                        input_win.noutrefresh() # Nothing to redraw, just put the cursor back in the field
+                    dirty["log"] = False
+                
+                if dirty["input"]:
+                    # Drawn last so the cursor ends up in the focused field
+                    input_win.resize(input_h, W)
+                    input_win.mvwin(title_h, 0) # Move below title bar
+                    draw_input_panel(input_win, input_values, focus_index, W)
+                    cursor = int(focus_index < NUM_INPUTS) # Shown only while a text field has focus
+                    if cursor != cursor_visible:
+                        curses.curs_set(cursor)
+                        cursor_visible = cursor
+                    dirty["input"] = False
+
+                curses.doupdate()
             
             # C. Handle Input
+            # Block until a key arrives (timed wait while the worker is logging), then
+            # read any keys already queued without waiting, so a burst gets one redraw
+            wait_ms = 0 if draining or log_backlog else (RUNNING_POLL_MS if is_running else IDLE_POLL_MS)
+            if wait_ms != poll_ms:
+                stdscr.timeout(wait_ms)
+                poll_ms = wait_ms
+
             # Get input from stdscr to catch keys outside of sub-windows
             c = stdscr.getch()
+            draining = c != -1
             if c == -1: 
                 continue
 
-            if c in (ord('q'), ord('Q')): 
+            if c in quit_keys: 
                 break
             
-            if c == curses.KEY_RESIZE:
+            if c == key_resize:
                 stdscr.clear()
+                dirty.update(title=True, input=True, log=True)
                 continue
             
             # --- Scrolling Logic (If running or manually scrolled) ---
             if is_running:
-                if c == curses.KEY_UP:
+                prev_offset = log_scroll_offset
+                if c == key_up:
                     log_scroll_offset = max(0, log_scroll_offset - 1)
                     user_scrolled = True
-                elif c == curses.KEY_DOWN:
+                elif c == key_down:
                     log_scroll_offset = min(max_scroll, log_scroll_offset + 1)
                     if log_scroll_offset == max_scroll:
                         user_scrolled = False
+                dirty["log"] |= log_scroll_offset != prev_offset
                 continue
                 
             # --- Input Navigation (Uses Arrow Keys, Tab, Enter) ---
-            if c == curses.KEY_UP:
+            prev_focus = focus_index
+            if c == key_up:
                 focus_index = max(0, focus_index - 1)
 
-            elif c == curses.KEY_DOWN or c == ord('\t'):
+            elif c in next_keys:
                 focus_index = min(NUM_INPUTS, focus_index + 1)
 
-            elif c == curses.KEY_ENTER or c == 10 or c == 13: # Enter/Return
+            elif c in enter_keys: # Enter/Return
                 if focus_index == NUM_INPUTS:
                     # START Button Pressed
-                    rmf = input_values.get('rmf_path', '').strip()
-                    src = input_values.get('source_dir', '').strip()
-                    patch = input_values.get('patch_dir', '').strip()
-                    target = input_values.get('target_dir', '').strip()
+                    rmf = input_values['rmf_path'].decode('utf-8', 'surrogateescape').strip()
+                    src = input_values['source_dir'].decode('utf-8', 'surrogateescape').strip()
+                    patch = input_values['patch_dir'].decode('utf-8', 'surrogateescape').strip()
+                    target = input_values['target_dir'].decode('utf-8', 'surrogateescape').strip()
                     
                     if not rmf or not os.path.exists(rmf) or not src or not os.path.exists(src):
-                        log_lines = [format_log({"action": "ERROR", "filename": "Validation", "path": "", "result": "RMF/Source path missing or invalid."})]
+                        log_lines.clear()
+                        log_lines.append(("ERROR", "Validation", "", "RMF/Source path missing or invalid."))
+                        dirty["log"] = True
+                        log_pad_written.clear()
                         log_scroll_offset = 0
                         user_scrolled = False
                         continue
                         
                     # 1. Clear log and set status
-                    log_lines = []
+                    log_lines.clear()
+                    log_pad_written.clear()
                     log_scroll_offset = 0
                     user_scrolled = False
                     
-                    log_lines.append(format_log({"action": "STATUS", "filename": "RMF", "path": "Parsing", "result": "Checking for VALUES.TXT..."}))
+                    log_lines.append(("STATUS", "RMF", "Parsing", "Checking for VALUES.TXT..."))
                     # Force redraw for immediate feedback using the log window
-                    draw_log_panel(log_win, log_lines, log_scroll_offset) 
+                    draw_log_panel(log_win, log_pad, log_lines, log_pad_written, log_scroll_offset)
+                    curses.doupdate()
+                    dirty["log"] = True # Later lines of this step still need drawing
 
                     # 2. Parse RMF in main thread
-                    rmf_root, values_txt_content = parse_rmf_for_dialog(rmf, log_queue)
+                    rmf_plan, values_txt_content = parse_rmf_for_dialog(rmf, log_queue)
                     
-                    if rmf_root is None:
+                    if rmf_plan is None:
                         continue 
 
                     # 3. Handle Dialog if VALUES.TXT is found
                     proceed = True
                     if values_txt_content:
-                        log_lines.append(format_log({"action": "STATUS", "filename": "Dialog", "path": "VALUES.TXT", "result": "Found. Awaiting confirmation."}))
-                        
                         # --- MODAL DIALOG CALL ---
                         modal_result = show_modal_dialog(
                             stdscr, # Pass the main screen for the modal to draw over everything
@@ -744,68 +1178,80 @@ def main(stdscr):
                         )
                         # --- END MODAL DIALOG ---
 
-                        # Restore stdscr properties after modal closes
-                        stdscr.timeout(50) 
-                        stdscr.keypad(True)
-                        curses.curs_set(0)
-                        stdscr.clear() # Clear potential modal remnants
+                        # The modal runs in its own window and leaves stdscr's timeout, keypad and
+                        # cursor as they were. Redrawing the panels repaints just the cells it covered
+                        dirty.update(title=True, input=True, log=True)
                         
                         if modal_result is None: 
                             break
-                        elif modal_result is False: 
-                            proceed = False
-                            log_lines.append(format_log({"action": "STATUS", "filename": "Process", "path": "Aborted", "result": "Cancelled by user."}))
+                        # One line records the decision once the dialog has closed
+                        proceed = modal_result
+                        log_lines.append(("STATUS", "Dialog", "VALUES.TXT", "Confirmed" if proceed else "Cancelled"))
                             
                     
                     if proceed:
-                        # 4. Start the worker thread
+                        # 4. Start the worker thread. A thread, not a process: its heavy work (kernel
+                        # file copies, 7z, aodbuild) already runs outside the GIL, and the plan and
+                        # queues are shared without pickling
                         is_running = True
-                        log_lines.append(format_log({"action": "STATUS", "filename": "Process", "path": "Execution", "result": "Starting worker thread..."}))
+                        log_lines.append(("STATUS", "Process", "Execution", "Starting worker thread..."))
                         
                         t = threading.Thread(
                             target=run_recovery_process,
-                            args=(rmf_root, src, patch, target, log_queue)
+                            args=(rmf_plan, src, patch, target, log_queue, progress_queue, done_event),
+                            daemon=True # Don't keep the process alive after the UI quits
                         )
                         t.start()
+
+                    # Only the worker (if started) needs the plan; don't pin it here for the whole run
+                    rmf_plan = values_txt_content = None
                     
 
                 elif 0 <= focus_index < NUM_INPUTS:
                     # Pressing Enter on an input field moves focus down
                     focus_index = min(NUM_INPUTS, focus_index + 1)
 
+            dirty["input"] |= focus_index != prev_focus
+
 
             # --- Text Editing (If focus is on an input field) ---
             if 0 <= focus_index < NUM_INPUTS and not is_running:
-                key_to_edit = INPUT_FIELDS[focus_index][1]
-                current_value = input_values.get(key_to_edit, "")
+                key_to_edit = INPUT_FIELD_KEYS[focus_index]
+                edit_buf = input_values[key_to_edit]
                 
                 if 32 <= c <= 126: 
-                    input_values[key_to_edit] = current_value + chr(c)
-                
-                elif c in (curses.KEY_BACKSPACE, 127, 8):
-                    input_values[key_to_edit] = current_value[:-1]
+                    # Take the rest of a typed/pasted run already waiting in the input buffer
+                    # in one go; the first other key is pushed back for the next pass
+                    if poll_ms != 0:
+                        stdscr.timeout(0)
+                        poll_ms = 0
+                    while 32 <= c <= 126 and c not in quit_keys:
+                        edit_buf.append(c)
+                        c = stdscr.getch()
+                    if c != -1:
+                        curses.ungetch(c)
+                    dirty["input"] = True
                 
-                # Re-draw input panel to reflect changes
-                draw_input_panel(input_win, input_values, focus_index, W)
-                input_win.refresh()
+                elif c in backspace_keys and edit_buf:
+                    # Drop one whole character: its UTF-8 continuation bytes, then the lead byte
+                    while edit_buf and edit_buf.pop() & 0xC0 == 0x80:
+                        pass
+                    dirty["input"] = True
 
 
         except curses.error:
-            pass
-        
-        except Exception as e:
-            log_lines.append(format_log({"action": "FATAL", "filename": "UI", "path": "", "result": f"Exception: {str(e)}"}))
-            is_running = False
-            stdscr.addstr(H - 1, 1, "FATAL ERROR. Press 'q' to quit.")
-            stdscr.refresh()
-            break
+            pass # Drawing past a small/resizing terminal's edge; the dirty panels retry next pass
 
 def _run_app():
-    """Wrapper function to initialize and run the curses application."""
+    """
+    Wrapper function to initialize and run the curses application.
+    Any error other than curses.error ends the UI and is reported here,
+    after curses.wrapper has restored the terminal.
+    """
     try:
         curses.wrapper(main)
     except Exception as e:
-        print(f"An error occurred in the Curses application: {e}", file=sys.stderr)
+        print(f"FATAL: An error occurred in the Curses application: {e}", file=sys.stderr)
         
 if __name__ == "__main__":
     _run_app()
\ No newline at end of file